@@ -2,8 +2,10 @@
 
 from .config import MCPServerConfig, ProviderConfig
 from .server import MCPServer, MCPServerState, create_server
+from .server_async import AsyncMCPServer
 
 __all__ = [
+    "AsyncMCPServer",
     "MCPServer",
     "MCPServerState",
     "MCPServerConfig",
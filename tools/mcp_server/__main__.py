@@ -4,6 +4,7 @@ from __future__ import annotations
 import argparse
 import logging
 import signal
+import threading
 from dataclasses import replace
 from typing import Optional
 
@@ -12,6 +13,8 @@ from .server import create_server
 
 LOGGER = logging.getLogger(__name__)
 
+_SHUTDOWN_SIGNALS = {signal.SIGINT, signal.SIGTERM}
+
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Run the Darktable MCP bridge server.")
@@ -23,6 +26,18 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Default provider used when requests do not specify one.",
     )
+    parser.add_argument(
+        "--backend",
+        choices=["threaded", "async"],
+        default=None,
+        help="Server implementation: threaded http.server or aiohttp based async (default: env or threaded).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of server processes sharing the port, 0 for one per CPU (threaded backend; default: env or 1).",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -32,7 +47,14 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _apply_overrides(config: MCPServerConfig, host: Optional[str], port: Optional[int], provider: Optional[str]) -> MCPServerConfig:
+def _apply_overrides(
+    config: MCPServerConfig,
+    host: Optional[str],
+    port: Optional[int],
+    provider: Optional[str],
+    backend: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> MCPServerConfig:
     updated = config
     if host is not None:
         updated = replace(updated, host=host)
@@ -40,6 +62,10 @@ def _apply_overrides(config: MCPServerConfig, host: Optional[str], port: Optiona
         updated = replace(updated, port=port)
     if provider is not None:
         updated = replace(updated, default_provider=provider)
+    if backend is not None:
+        updated = replace(updated, backend=backend)
+    if workers is not None:
+        updated = replace(updated, workers=workers)
     return updated
 
 
@@ -50,16 +76,33 @@ def main() -> None:
     logging.basicConfig(level=getattr(logging, args.log_level.upper()), format="[%(levelname)s] %(name)s: %(message)s")
 
     config = MCPServerConfig.from_env()
-    config = _apply_overrides(config, args.host, args.port, args.provider)
+    config = _apply_overrides(config, args.host, args.port, args.provider, args.backend, args.workers)
+
+    # Block the shutdown signals before any thread exists so every thread inherits the mask and
+    # they are only ever delivered to the waiter thread below, never inside a Python signal handler.
+    use_sigwait = hasattr(signal, "pthread_sigmask") and hasattr(signal, "sigwait")
+    if use_sigwait:
+        signal.pthread_sigmask(signal.SIG_BLOCK, _SHUTDOWN_SIGNALS)
 
     server = create_server(config)
+    # Fork any worker processes while this is still the only thread.
+    server.spawn_workers()
+    shutdown_event = threading.Event()
 
-    def _shutdown(signum: int, frame) -> None:  # type: ignore[override]
+    def _wait_for_signal() -> None:
+        signum = signal.sigwait(_SHUTDOWN_SIGNALS)
         LOGGER.info("Received signal %s, shutting down...", signum)
         server.stop()
+        shutdown_event.set()
+
+    def _interrupt(signum: int, frame) -> None:  # type: ignore[override]
+        raise KeyboardInterrupt
 
-    signal.signal(signal.SIGINT, _shutdown)
-    signal.signal(signal.SIGTERM, _shutdown)
+    if use_sigwait:
+        threading.Thread(target=_wait_for_signal, name="mcp-signal-waiter", daemon=True).start()
+    else:  # pragma: no cover - platforms without sigwait (Windows)
+        # Let SIGTERM unwind like Ctrl+C; wait_forever() then stops the server outside the handler.
+        signal.signal(signal.SIGTERM, _interrupt)
 
     LOGGER.info(
         "MCP server ready on %s:%s (default provider: %s)",
@@ -68,6 +111,8 @@ def main() -> None:
         server.config.default_provider,
     )
     server.wait_forever()
+    if use_sigwait:
+        shutdown_event.wait(timeout=5)
 
 
 if __name__ == "__main__":  # pragma: no cover - CLI entry point
@@ -1,29 +1,82 @@
 """HTTP clients for the LLM providers supported by the Darktable MCP server."""
 from __future__ import annotations
 
+import asyncio
 import base64
-import json
 import logging
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, List, Optional
 from urllib import error, request
+from urllib.parse import urlsplit
+
+try:  # pragma: no cover - optional dependency
+    import urllib3
+except ImportError:  # pragma: no cover - fall back to the standard library
+    urllib3 = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional dependency, only needed by the async backend
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore[assignment]
 
 from .config import ProviderConfig
+from .jsonutil import dumps, loads
 
 LOGGER = logging.getLogger(__name__)
 
+# Keep-alive connections kept per provider pool; sized above the default batch concurrency.
+_POOL_MAXSIZE = 16
+# Upper bound for establishing a connection; the provider timeout applies to reads.
+_CONNECT_TIMEOUT = 5.0
+
 
 class LLMClientError(RuntimeError):
     """Raised when a provider interaction fails."""
 
 
-def _post_json(url: str, payload: Dict[str, Any], headers: Dict[str, str], timeout: float) -> Dict[str, Any]:
-    """Send a JSON request and return the decoded response."""
-    data = json.dumps(payload).encode("utf-8")
+class _ProviderEndpoint:
+    """A provider URL bound to its own keep-alive connection pool.
+
+    Each client owns the pool for its ``base_url`` so connections are reused
+    across calls, timeouts follow that provider's configuration, and busy
+    providers do not contend for a shared pool.
+    """
+
+    def __init__(self, url: str, timeout: float):
+        self.url = url
+        self.timeout = timeout
+        parts = urlsplit(url)
+        self._path = parts.path + (f"?{parts.query}" if parts.query else "")
+        self._pool = None
+        if urllib3 is not None:
+            self._pool = urllib3.connection_from_url(
+                url,
+                maxsize=_POOL_MAXSIZE,
+                timeout=urllib3.Timeout(connect=min(_CONNECT_TIMEOUT, timeout), read=timeout),
+            )
+
+    def post_json(self, payload: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
+        """Send a JSON request and return the decoded response."""
+        data = dumps(payload)
+        if self._pool is None:
+            return _post_json_urllib(self.url, data, headers, self.timeout)
+        try:
+            response = self._pool.urlopen("POST", self._path, body=data, headers=headers)
+        except urllib3.exceptions.HTTPError as exc:
+            LOGGER.error("Transport error for %s: %s", self.url, exc)
+            raise LLMClientError(f"Transport error contacting provider: {exc}") from exc
+        if response.status >= 400:
+            message = response.data.decode("utf-8", errors="replace") or response.reason
+            LOGGER.error("HTTP error for %s: %s", self.url, message)
+            raise LLMClientError(f"HTTP {response.status} error from provider: {message}")
+        return loads(response.data)
+
+
+def _post_json_urllib(url: str, data: bytes, headers: Dict[str, str], timeout: float) -> Dict[str, Any]:
+    """Fallback transport used when urllib3 is not installed."""
     req = request.Request(url, data=data, headers=headers, method="POST")
     try:
         with request.urlopen(req, timeout=timeout) as response:
-            body = response.read().decode("utf-8")
-            return json.loads(body)
+            return loads(response.read())
     except error.HTTPError as exc:
         message = exc.read().decode("utf-8", errors="replace") if exc.fp else exc.reason
         LOGGER.error("HTTP error for %s: %s", url, message)
@@ -33,11 +86,35 @@ def _post_json(url: str, payload: Dict[str, Any], headers: Dict[str, str], timeo
         raise LLMClientError(f"Transport error contacting provider: {exc.reason}") from exc
 
 
+async def _async_post_json(
+    session: "aiohttp.ClientSession",
+    url: str,
+    payload: Dict[str, Any],
+    headers: Dict[str, str],
+    timeout: float,
+) -> Dict[str, Any]:
+    """Asynchronous counterpart of :meth:`_ProviderEndpoint.post_json` using a shared aiohttp session."""
+    data = dumps(payload)
+    try:
+        async with session.post(url, data=data, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            body = await response.read()
+            status, reason = response.status, response.reason
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+        LOGGER.error("Transport error for %s: %s", url, exc)
+        raise LLMClientError(f"Transport error contacting provider: {exc}") from exc
+    if status >= 400:
+        message = body.decode("utf-8", errors="replace") or reason
+        LOGGER.error("HTTP error for %s: %s", url, message)
+        raise LLMClientError(f"HTTP {status} error from provider: {message}")
+    return loads(body)
+
+
 class LMStudioClient:
     """Client for LM Studio's OpenAI-compatible API."""
 
     def __init__(self, config: ProviderConfig):
         self._config = config
+        self._chat_endpoint = _ProviderEndpoint(f"{config.base_url.rstrip('/')}/v1/chat/completions", config.timeout)
 
     def _headers(self) -> Dict[str, str]:
         headers = {"Content-Type": "application/json"}
@@ -45,25 +122,50 @@ class LMStudioClient:
             headers["Authorization"] = f"Bearer {self._config.api_key}"
         return headers
 
-    def chat(self, messages: List[Dict[str, Any]], model: Optional[str] = None, temperature: float = 0.2) -> Dict[str, Any]:
+    def _chat_payload(self, messages: List[Dict[str, Any]], model: Optional[str], temperature: float) -> Dict[str, Any]:
         model_name = model or self._config.default_model
         if not model_name:
             raise LLMClientError("No model configured for LM Studio.")
-        payload: Dict[str, Any] = {
+        return {
             "model": model_name,
             "messages": messages,
             "temperature": temperature,
         }
-        url = f"{self._config.base_url.rstrip('/')}/v1/chat/completions"
-        return _post_json(url, payload, self._headers(), self._config.timeout)
 
-    def vision(self, prompt: str, image_data: Iterable[str], model: Optional[str] = None) -> Dict[str, Any]:
+    @staticmethod
+    def _vision_messages(prompt: str, image_data: List[str]) -> List[Dict[str, Any]]:
+        content = [
+            {"type": "input_text", "text": prompt},
+            *({"type": "input_image", "image": image} for image in image_data),
+        ]
+        return [{"role": "user", "content": content}]
+
+    def chat(self, messages: List[Dict[str, Any]], model: Optional[str] = None, temperature: float = 0.2) -> Dict[str, Any]:
+        payload = self._chat_payload(messages, model, temperature)
+        return self._chat_endpoint.post_json(payload, self._headers())
+
+    def vision(self, prompt: str, image_data: List[str], model: Optional[str] = None) -> Dict[str, Any]:
         """Perform a multimodal request combining text and images."""
-        content: List[Dict[str, str]] = [{"type": "input_text", "text": prompt}]
-        for image in image_data:
-            content.append({"type": "input_image", "image": image})
-        messages = [{"role": "user", "content": content}]
-        return self.chat(messages, model=model)
+        return self.chat(self._vision_messages(prompt, image_data), model=model)
+
+    async def async_chat(
+        self,
+        session: "aiohttp.ClientSession",
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        temperature: float = 0.2,
+    ) -> Dict[str, Any]:
+        payload = self._chat_payload(messages, model, temperature)
+        return await _async_post_json(session, self._chat_endpoint.url, payload, self._headers(), self._config.timeout)
+
+    async def async_vision(
+        self,
+        session: "aiohttp.ClientSession",
+        prompt: str,
+        image_data: List[str],
+        model: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        return await self.async_chat(session, self._vision_messages(prompt, image_data), model=model)
 
 
 class OllamaClient:
@@ -71,33 +173,69 @@ class OllamaClient:
 
     def __init__(self, config: ProviderConfig):
         self._config = config
+        self._chat_endpoint = _ProviderEndpoint(f"{config.base_url.rstrip('/')}/api/chat", config.timeout)
 
-    def chat(self, messages: List[Dict[str, Any]], model: Optional[str] = None) -> Dict[str, Any]:
+    def _chat_payload(self, messages: List[Dict[str, Any]], model: Optional[str]) -> Dict[str, Any]:
         model_name = model or self._config.default_model
         if not model_name:
             raise LLMClientError("No model configured for Ollama.")
-        payload = {
+        return {
             "model": model_name,
             "messages": messages,
             "stream": False,
         }
-        url = f"{self._config.base_url.rstrip('/')}/api/chat"
-        return _post_json(url, payload, {"Content-Type": "application/json"}, self._config.timeout)
 
-    def vision(self, prompt: str, image_data: Iterable[str], model: Optional[str] = None) -> Dict[str, Any]:
+    @staticmethod
+    def _vision_message(prompt: str, image_data: List[str]) -> Dict[str, Any]:
         message: Dict[str, Any] = {"role": "user", "content": prompt}
-        images_list = list(image_data)
-        if images_list:
-            message["images"] = images_list
-        return self.chat([message], model=model)
+        if image_data:
+            # Callers hand over the list built by _prepare_images; reuse it instead of copying.
+            message["images"] = image_data
+        return message
+
+    def chat(self, messages: List[Dict[str, Any]], model: Optional[str] = None) -> Dict[str, Any]:
+        payload = self._chat_payload(messages, model)
+        return self._chat_endpoint.post_json(payload, {"Content-Type": "application/json"})
+
+    def vision(self, prompt: str, image_data: List[str], model: Optional[str] = None) -> Dict[str, Any]:
+        return self.chat([self._vision_message(prompt, image_data)], model=model)
+
+    async def async_chat(
+        self,
+        session: "aiohttp.ClientSession",
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        payload = self._chat_payload(messages, model)
+        return await _async_post_json(
+            session, self._chat_endpoint.url, payload, {"Content-Type": "application/json"}, self._config.timeout
+        )
+
+    async def async_vision(
+        self,
+        session: "aiohttp.ClientSession",
+        prompt: str,
+        image_data: List[str],
+        model: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        return await self.async_chat(session, [self._vision_message(prompt, image_data)], model=model)
+
+
+# Multiple of 3 so every chunk encodes to base64 without padding.
+_ENCODE_CHUNK_SIZE = 57 * 1024
 
 
 def encode_image_to_base64(path: str) -> str:
-    """Encode a binary image file as a base64 data URI."""
+    """Encode a binary image file as a bare base64 string.
+
+    The file is streamed in fixed-size chunks so only the encoded output,
+    not a second full copy of the raw bytes, is held in memory.
+    """
+    encoded = bytearray()
     with open(path, "rb") as handle:
-        raw = handle.read()
-    encoded = base64.b64encode(raw).decode("ascii")
-    return encoded
+        for chunk in iter(lambda: handle.read(_ENCODE_CHUNK_SIZE), b""):
+            encoded += base64.b64encode(chunk)
+    return encoded.decode("ascii")
 
 
 __all__ = [
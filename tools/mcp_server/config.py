@@ -6,11 +6,18 @@ behaviour can be adjusted without editing the source code.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 import os
+import sys
 
+# Configuration objects are read on every provider call; drop the per-instance
+# __dict__ where the interpreter supports slotted dataclasses (Python 3.10+).
+_DATACLASS_OPTIONS: Dict[str, bool] = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS["slots"] = True
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ProviderConfig:
     """Holds settings for a single LLM provider."""
 
@@ -18,8 +25,7 @@ class ProviderConfig:
     api_key: Optional[str] = None
     default_model: Optional[str] = None
     timeout: float = 60.0
-
-    def to_dict(self) -> Dict[str, Optional[str]]:
+    def to_dict(self) -> Dict[str, Any]:
         """Return a serialisable representation."""
         return {
             "base_url": self.base_url,
@@ -29,13 +35,16 @@ class ProviderConfig:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MCPServerConfig:
     """Top-level server configuration."""
 
     host: str = "127.0.0.1"
     port: int = 8082
     default_provider: str = "lmstudio"
+    batch_workers: int = 8
+    backend: str = "threaded"
+    workers: int = 1
     lm_studio: ProviderConfig = field(
         default_factory=lambda: ProviderConfig(
             base_url=os.environ.get("LM_STUDIO_URL", "http://localhost:1234"),
@@ -51,22 +60,34 @@ class MCPServerConfig:
             timeout=float(os.environ.get("OLLAMA_TIMEOUT", "60")),
         )
     )
-
     @classmethod
     def from_env(cls) -> "MCPServerConfig":
         """Create a configuration instance reading from environment variables."""
         host = os.environ.get("DARKTABLE_MCP_HOST", "127.0.0.1")
         port = int(os.environ.get("DARKTABLE_MCP_PORT", "8082"))
         default_provider = os.environ.get("DARKTABLE_MCP_PROVIDER", "lmstudio")
-        config = cls(host=host, port=port, default_provider=default_provider)
+        batch_workers = int(os.environ.get("DARKTABLE_MCP_BATCH_WORKERS", "8"))
+        backend = os.environ.get("DARKTABLE_MCP_BACKEND", "threaded")
+        workers = int(os.environ.get("DARKTABLE_MCP_WORKERS", "1"))
+        config = cls(
+            host=host,
+            port=port,
+            default_provider=default_provider,
+            batch_workers=batch_workers,
+            backend=backend,
+            workers=workers,
+        )
         return config
 
-    def as_dict(self) -> Dict[str, Dict[str, Optional[str]]]:
+    def as_dict(self) -> Dict[str, Any]:
         """Expose configuration details for diagnostics without secrets."""
         return {
             "host": self.host,
             "port": self.port,
             "default_provider": self.default_provider,
+            "batch_workers": self.batch_workers,
+            "backend": self.backend,
+            "workers": self.workers,
             "providers": {
                 "lmstudio": self.lm_studio.to_dict(),
                 "ollama": self.ollama.to_dict(),
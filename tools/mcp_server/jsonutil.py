@@ -0,0 +1,134 @@
+"""JSON helpers shared by the Darktable MCP server and its clients.
+
+Payloads routinely carry base64-encoded images, so serialisation is a hot
+path.  ``orjson`` is used when available, otherwise the standard library.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Collection, Dict, Protocol
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the standard library
+    orjson = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional dependency
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - fall back to a full parse
+    ijson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+if orjson is not None:
+
+    def dumps(obj: Any) -> bytes:
+        """Serialise ``obj`` to UTF-8 encoded JSON."""
+        return orjson.dumps(obj)
+
+    def loads(data: bytes | str) -> Any:
+        """Deserialise JSON from ``bytes`` or ``str``."""
+        return orjson.loads(data)
+
+else:
+
+    def dumps(obj: Any) -> bytes:
+        """Serialise ``obj`` to UTF-8 encoded JSON."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(data: bytes | str) -> Any:
+        """Deserialise JSON from ``bytes`` or ``str``."""
+        return json.loads(data)
+
+
+_JSON_TYPE_NAMES: Dict[type, str] = {
+    type(None): "null",
+    bool: "bool",
+    int: "int",
+    float: "float",
+    str: "str",
+    list: "array",
+    dict: "object",
+}
+# ijson events that open a value other than an object, mapped to the JSON type they start.
+_EVENT_TYPE_NAMES = {"start_array": "array", "string": "str", "boolean": "bool", "null": "null"}
+
+
+def json_type_name(value: Any) -> str:
+    """Name of the JSON type of a decoded ``value``, spelled the way msgspec reports it."""
+    return _JSON_TYPE_NAMES.get(type(value), type(value).__name__)
+
+
+class NotAnObjectError(ValueError):
+    """Raised by :func:`load_fields` when the document is not a JSON object."""
+
+    def __init__(self, json_type: str):
+        super().__init__("JSON payload must be an object")
+        self.json_type = json_type
+
+
+class Readable(Protocol):
+    """Binary stream ``load_fields`` can read from (files, sockets, ``BaseHTTPRequestHandler.rfile``)."""
+
+    def read(self, size: int = ...) -> bytes: ...
+
+
+class _BoundedReader:
+    """File-like view exposing at most ``length`` bytes of ``stream``."""
+
+    def __init__(self, stream: Readable, length: int):
+        self._stream = stream
+        self._remaining = length
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._stream.read(size) if size else b""
+        self._remaining -= len(data)
+        return data
+
+
+def _stream_fields(stream: Readable, fields: Collection[str]) -> Dict[str, Any]:
+    """Build only the requested top-level members while the parser walks the stream."""
+    result: Dict[str, Any] = {}
+    builder = None
+    name = ""
+    depth = 0
+    try:
+        for _prefix, event, value in ijson.parse(stream, use_float=True):
+            if depth == 0 and event != "start_map":
+                raise NotAnObjectError(_EVENT_TYPE_NAMES.get(event) or json_type_name(value))
+            if depth == 1 and event == "map_key":
+                name = value
+                builder = ijson.ObjectBuilder() if value in fields else None
+                continue
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            if builder is not None:
+                builder.event(event, value)
+                if depth == 1:
+                    result[name] = builder.value
+                    builder = None
+    except ijson.JSONError as exc:
+        raise JSONDecodeError(str(exc).splitlines()[0], "", 0) from exc
+    return result
+
+
+def load_fields(stream: Readable, length: int, fields: Collection[str]) -> Dict[str, Any]:
+    """Read a JSON object of ``length`` bytes from ``stream`` keeping only ``fields``.
+
+    With ``ijson`` installed the body is parsed incrementally and members
+    outside ``fields`` are skipped without being materialised.
+    """
+    if ijson is not None:
+        return _stream_fields(_BoundedReader(stream, length), fields)
+    document = loads(stream.read(length))
+    if not isinstance(document, dict):
+        raise NotAnObjectError(json_type_name(document))
+    return {key: document[key] for key in fields if key in document}
+
+
+__all__ = ["JSONDecodeError", "NotAnObjectError", "Readable", "dumps", "json_type_name", "load_fields", "loads"]
@@ -0,0 +1,155 @@
+"""Typed request bodies for the Darktable MCP server endpoints.
+
+With ``msgspec`` installed the request structs are decoded and type-checked
+straight from the JSON bytes in C.  Without it, equivalent dataclasses are
+built from the parsed body and validated in Python.
+"""
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+try:  # pragma: no cover - optional dependency
+    import msgspec
+except ImportError:  # pragma: no cover - fall back to Python validation
+    msgspec = None  # type: ignore[assignment]
+
+from .jsonutil import JSONDecodeError, NotAnObjectError, Readable, json_type_name, load_fields
+
+if msgspec is not None:
+
+    class ChatRequest(msgspec.Struct):
+        """Body of ``POST /chat``."""
+
+        messages: List[Dict[str, Any]] = []
+        provider: Optional[str] = None
+        model: Optional[str] = None
+        temperature: float = 0.2
+
+    class VisionRequest(msgspec.Struct):
+        """Body of ``POST /analyze``, ``/batch`` and ``/batch_stream``."""
+
+        # Entries are validated one by one when the images are prepared, so a bad entry only fails its own item.
+        images: List[Any] = []
+        provider: Optional[str] = None
+        model: Optional[str] = None
+        prompt: Optional[str] = None
+
+else:
+
+    @dataclass(frozen=True)
+    class ChatRequest:  # type: ignore[no-redef]
+        """Body of ``POST /chat``."""
+
+        messages: List[Dict[str, Any]] = field(default_factory=list)
+        provider: Optional[str] = None
+        model: Optional[str] = None
+        temperature: float = 0.2
+
+    @dataclass(frozen=True)
+    class VisionRequest:  # type: ignore[no-redef]
+        """Body of ``POST /analyze``, ``/batch`` and ``/batch_stream``."""
+
+        images: List[Any] = field(default_factory=list)
+        provider: Optional[str] = None
+        model: Optional[str] = None
+        prompt: Optional[str] = None
+
+
+Request = Union[ChatRequest, VisionRequest]
+RequestT = TypeVar("RequestT", ChatRequest, VisionRequest)
+
+# Accepted Python types and their msgspec spelling per member, so the fallback validator mirrors the
+# annotations above and reports errors in the same format as msgspec.
+_FIELD_TYPES: Dict[str, Tuple[Tuple[type, ...], str]] = {
+    "messages": ((list,), "array"),
+    "images": ((list,), "array"),
+    "provider": ((str, type(None)), "str | null"),
+    "model": ((str, type(None)), "str | null"),
+    "prompt": ((str, type(None)), "str | null"),
+    "temperature": ((int, float), "float"),
+}
+
+
+def _type_error(expected: str, got: str, path: str = "") -> ValueError:
+    location = f" - at `${path}`" if path else ""
+    return ValueError(f"Invalid request: Expected `{expected}`, got `{got}`{location}")
+
+
+def request_fields(request_type: Type[Request]) -> Tuple[str, ...]:
+    """Names of the top-level members ``request_type`` reads."""
+    if msgspec is not None:
+        return request_type.__struct_fields__
+    return tuple(item.name for item in fields(request_type))
+
+
+def _check(request: RequestT) -> RequestT:
+    # Checks the type system cannot express, shared by both implementations.
+    if isinstance(request, ChatRequest):
+        if not request.messages:
+            raise ValueError("'messages' must be a non-empty list.")
+    elif not request.images:
+        raise ValueError("'images' must be a non-empty list.")
+    return request
+
+
+def _build(payload: Any, request_type: Type[RequestT]) -> RequestT:
+    if not isinstance(payload, dict):
+        raise _type_error("object", json_type_name(payload))
+    values: Dict[str, Any] = {}
+    for name in request_fields(request_type):
+        if name not in payload:
+            continue
+        value = payload[name]
+        accepted, expected = _FIELD_TYPES[name]
+        if isinstance(value, bool) or not isinstance(value, accepted):
+            raise _type_error(expected, json_type_name(value), f".{name}")
+        values[name] = float(payload[name]) if name == "temperature" else value
+    for index, message in enumerate(values.get("messages", ())):
+        if not isinstance(message, dict):
+            raise _type_error("object", json_type_name(message), f".messages[{index}]")
+    return request_type(**values)
+
+
+def convert(payload: Union[Dict[str, Any], RequestT], request_type: Type[RequestT]) -> RequestT:
+    """Validate an already parsed body into ``request_type``; instances pass through unchanged."""
+    if isinstance(payload, request_type):
+        return payload
+    if msgspec is None:
+        return _check(_build(payload, request_type))
+    try:
+        return _check(msgspec.convert(payload, request_type))
+    except msgspec.ValidationError as exc:
+        raise ValueError(f"Invalid request: {exc}") from exc
+
+
+def decode(stream: Readable, length: int, request_type: Type[RequestT]) -> RequestT:
+    """Read ``length`` bytes of JSON from ``stream`` and validate them into ``request_type``.
+
+    Raises :class:`ValueError` for malformed JSON as well as for invalid requests.
+    """
+    if msgspec is None:
+        try:
+            payload = load_fields(stream, length, request_fields(request_type))
+        except NotAnObjectError as exc:
+            raise _type_error("object", exc.json_type) from exc
+        except JSONDecodeError as exc:
+            raise ValueError(f"Invalid JSON payload: {exc.msg}") from exc
+        return _check(_build(payload, request_type))
+    return decode_bytes(stream.read(length), request_type)
+
+
+def decode_bytes(data: bytes, request_type: Type[RequestT]) -> RequestT:
+    """Like :func:`decode` for a body that has already been read."""
+    if msgspec is None:
+        return decode(io.BytesIO(data), len(data), request_type)
+    try:
+        return _check(msgspec.json.decode(data, type=request_type))
+    except msgspec.ValidationError as exc:
+        raise ValueError(f"Invalid request: {exc}") from exc
+    except msgspec.DecodeError as exc:
+        raise ValueError(f"Invalid JSON payload: {exc}") from exc
+
+
+__all__ = ["ChatRequest", "Request", "VisionRequest", "convert", "decode", "decode_bytes", "request_fields"]
@@ -1,14 +1,23 @@
 """HTTP entry point for the Darktable MCP server."""
 from __future__ import annotations
 
-import json
+import base64
 import logging
 import mimetypes
+import os
+import signal
+import socket
+import sys
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from email import policy
+from email.message import Message
+from email.parser import BytesHeaderParser
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from socketserver import ThreadingMixIn
-from typing import Any, Dict, Iterable, List, Tuple
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+from urllib.parse import parse_qs, urlparse
 
 from .clients import (
     LMStudioClient,
@@ -17,9 +26,148 @@ from .clients import (
     encode_image_to_base64,
 )
 from .config import MCPServerConfig
+from .jsonutil import dumps
+from .schema import ChatRequest, RequestT, VisionRequest, convert, decode
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .server_async import AsyncMCPServer
 
 LOGGER = logging.getLogger(__name__)
 
+# State methods take either a decoded request struct or a plain dict, which is validated on entry.
+ChatPayload = Union[ChatRequest, Dict[str, Any]]
+VisionPayload = Union[VisionRequest, Dict[str, Any]]
+
+# Sent on every response; kept pre-encoded so hot paths only concatenate bytes.
+_CORS: Tuple[Tuple[str, str], ...] = (
+    ("Access-Control-Allow-Origin", "*"),
+    ("Access-Control-Allow-Methods", "GET, POST, OPTIONS"),
+    ("Access-Control-Allow-Headers", "Content-Type"),
+)
+_CORS_HEADER_LINES = "".join(f"{name}: {value}\r\n" for name, value in _CORS).encode("latin-1")
+
+
+class _EncodedImageCache:
+    """Bounded LRU of base64 encodings keyed by path, modification time and size."""
+
+    def __init__(self, max_entries: int = 64, max_bytes: int = 256 * 1024 * 1024):
+        self._entries: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def encode(self, path: str) -> str:
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+        encoded = encode_image_to_base64(path)
+        if len(encoded) > self._max_bytes:
+            return encoded
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = encoded
+                self._size += len(encoded)
+            while len(self._entries) > self._max_entries or self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+        return encoded
+
+
+# Shared across request threads: clients often resend the same files on retries or in /batch.
+_ENCODE_CACHE = _EncodedImageCache()
+
+# MIME type per lower-cased file extension, so mimetypes' tables are consulted once per suffix. Only
+# extensions mimetypes knows are stored: the keys come from request paths and must not grow without bound.
+_MIME_CACHE: Dict[str, str] = {}
+
+
+def _guess_mime_type(path: str) -> Optional[str]:
+    extension = os.path.splitext(path)[1].lower()
+    try:
+        return _MIME_CACHE[extension]
+    except KeyError:
+        mime_type = mimetypes.guess_type("x" + extension)[0]
+        if mime_type is not None:
+            _MIME_CACHE[extension] = mime_type
+        return mime_type
+
+
+# Text parameters accepted by /analyze_raw alongside the binary image data.
+_RAW_FIELDS = ("prompt", "provider", "model")
+
+
+def _declared_mime(content_type: Optional[str]) -> Optional[str]:
+    """MIME type from a ``Content-Type`` value, ``None`` when it does not identify the image format."""
+    mime = (content_type or "").split(";", 1)[0].strip().lower() or None
+    return None if mime == "application/octet-stream" else mime
+
+
+def _multipart_parts(content_type: str, body: Union[bytes, bytearray]) -> Iterator[Tuple[Message, memoryview]]:
+    """Yield ``(headers, data)`` for every part of a ``multipart/form-data`` ``body``.
+
+    Only the small part headers go through the email parser; the part data
+    are zero-copy views into ``body``, so large uploads are not duplicated.
+    """
+    header_parser = BytesHeaderParser(policy=policy.HTTP)
+    boundary = header_parser.parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode("latin-1")).get_param("boundary")
+    if not isinstance(boundary, str) or not boundary:
+        raise ValueError("Malformed multipart/form-data body")
+    delimiter = b"\r\n--" + boundary.encode("latin-1")
+    view = memoryview(body)
+    # The first delimiter may open the body without a preceding line break.
+    position = body.find(delimiter[2:])
+    if position < 0:
+        raise ValueError("Malformed multipart/form-data body")
+    position += len(delimiter) - 2
+    while not body.startswith(b"--", position):
+        header_start = body.find(b"\r\n", position) + 2
+        if header_start < 2:
+            raise ValueError("Malformed multipart/form-data body")
+        if body.startswith(b"\r\n", header_start):
+            headers_end = data_start = header_start + 2
+        else:
+            headers_end = body.find(b"\r\n\r\n", header_start)
+            data_start = headers_end + 4
+        data_end = body.find(delimiter, data_start)
+        if headers_end < 0 or data_end < 0:
+            raise ValueError("Malformed multipart/form-data body")
+        yield header_parser.parsebytes(bytes(view[header_start:headers_end]) + b"\r\n\r\n"), view[data_start:data_end]
+        position = data_end + len(delimiter)
+
+
+def _raw_image_payload(content_type: str, body: Union[bytes, bytearray], query: str) -> Dict[str, Any]:
+    """Build an ``/analyze`` payload from a binary ``/analyze_raw`` request.
+
+    The body is either the image itself (its ``Content-Type`` is used as MIME
+    type) or ``multipart/form-data`` with one or more file parts plus optional
+    ``prompt``, ``provider`` and ``model`` fields.  ``prompt``, ``provider`` and
+    ``model`` may also be passed as query parameters.  Images are base64-encoded
+    exactly once here and handed on through the ``{"base64": ...}`` entry form.
+    """
+    payload: Dict[str, Any] = {key: values[0] for key, values in parse_qs(query).items() if key in _RAW_FIELDS}
+    images: List[Dict[str, Any]] = []
+    if content_type.lower().startswith("multipart/form-data"):
+        for part, data in _multipart_parts(content_type, body):
+            name = part.get_param("name", header="content-disposition")
+            filename = part.get_filename()
+            if filename is not None:
+                # get_content_type() reports text/plain for parts without the header; trust only an explicit type.
+                mime = _declared_mime(part.get("Content-Type")) or _guess_mime_type(filename)
+                images.append({"base64": base64.b64encode(data).decode("ascii"), "mime": mime})
+            elif name in _RAW_FIELDS:
+                payload[name] = bytes(data).decode(part.get_content_charset() or "utf-8", errors="replace")
+    elif body:
+        images.append({"base64": base64.b64encode(body).decode("ascii"), "mime": _declared_mime(content_type)})
+    if not images:
+        raise ValueError("No image data in request body")
+    payload["images"] = images
+    return payload
+
 
 class ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
     """Simple multi-threaded HTTP server."""
@@ -27,70 +175,122 @@ class ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
     daemon_threads = True
 
 
+class ReusePortHTTPServer(ThreadedHTTPServer):
+    """Threaded server whose listening socket can be bound by several processes at once.
+
+    Each worker process binds its own socket with ``SO_REUSEPORT`` and the
+    kernel spreads incoming connections across them.
+    """
+
+    def server_bind(self) -> None:
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
+_WORKER_SIGNALS = {signal.SIGINT, signal.SIGTERM}
+
+
+# How often a worker checks whether the process that forked it is still alive.
+_PARENT_POLL_INTERVAL = 1.0
+
+
+def _resolve_workers(requested: int) -> int:
+    workers = requested if requested > 0 else (os.cpu_count() or 1)
+    # Only Linux spreads connections across plain SO_REUSEPORT sockets; elsewhere one socket would get them all.
+    if workers > 1 and not (sys.platform.startswith("linux") and hasattr(socket, "SO_REUSEPORT")):
+        LOGGER.warning("Worker processes are only supported on Linux, serving from a single process")
+        return 1
+    return workers
+
+
 class MCPServerState:
     """Holds state shared across HTTP requests."""
 
     def __init__(self, config: MCPServerConfig):
         self.config = config
+        lm_studio = LMStudioClient(config.lm_studio)
+        ollama = OllamaClient(config.ollama)
         self._clients: Dict[str, Any] = {
-            "lmstudio": LMStudioClient(config.lm_studio),
-            "ollama": OllamaClient(config.ollama),
+            "lmstudio": lm_studio,
+            "ollama": ollama,
+        }
+        # Provider dispatch resolved once; Ollama's chat API takes no temperature.
+        self._chat_fns: Dict[str, Callable[[List[Dict[str, Any]], Any, Any], Dict[str, Any]]] = {
+            "lmstudio": lambda messages, model, temperature: lm_studio.chat(messages, model=model, temperature=temperature),
+            "ollama": lambda messages, model, temperature: ollama.chat(messages, model=model),
+        }
+        self._vision_fns: Dict[str, Callable[..., Dict[str, Any]]] = {
+            "lmstudio": lm_studio.vision,
+            "ollama": ollama.vision,
         }
-        LOGGER.debug("Loaded MCP server configuration: %s", self.config.as_dict())
+        # The configuration is immutable, so the /config response body is serialised once.
+        self.config_body = dumps(config.as_dict())
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Loaded MCP server configuration: %s", config.as_dict())
 
     def get_client(self, provider: str | None) -> Tuple[str, Any]:
+        provider_name = self._provider_name(provider)
+        return provider_name, self._clients[provider_name]
+
+    def _provider_name(self, provider: str | None) -> str:
         provider_name = (provider or self.config.default_provider).lower()
         if provider_name not in self._clients:
             raise ValueError(f"Unsupported provider '{provider_name}'.")
-        return provider_name, self._clients[provider_name]
+        return provider_name
 
-    def chat(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        provider_name, client = self.get_client(payload.get("provider"))
-        messages = payload.get("messages")
-        if not isinstance(messages, list) or not messages:
-            raise ValueError("'messages' must be a non-empty list.")
-        model = payload.get("model")
-        temperature = payload.get("temperature", 0.2)
-        if hasattr(client, "chat"):
-            return {
-                "provider": provider_name,
-                "response": client.chat(messages, model=model, temperature=temperature)  # type: ignore[arg-type]
-                if provider_name == "lmstudio"
-                else client.chat(messages, model=model),
-            }
-        raise ValueError(f"Provider '{provider_name}' does not support chat operations.")
-
-    def vision(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        provider_name, client = self.get_client(payload.get("provider"))
-        prompt = payload.get("prompt") or "Describe the image"
-        images = payload.get("images")
-        if not isinstance(images, list) or not images:
-            raise ValueError("'images' must be a non-empty list.")
+    def chat(self, payload: ChatPayload) -> Dict[str, Any]:
+        provider_name, messages, model, temperature = self._chat_arguments(payload)
+        return {"provider": provider_name, "response": self._chat_fns[provider_name](messages, model, temperature)}
+
+    def vision(self, payload: VisionPayload) -> Dict[str, Any]:
+        provider_name, prompt, images, model = self._vision_arguments(payload)
         prepared_images = self._prepare_images(provider_name, images)
-        model = payload.get("model")
-        if not hasattr(client, "vision"):
-            raise ValueError(f"Provider '{provider_name}' does not support vision analysis.")
-        response = client.vision(prompt, prepared_images, model=model)
+        response = self._vision_fns[provider_name](prompt, prepared_images, model=model)
         return {
             "provider": provider_name,
             "response": response,
         }
 
-    def batch(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        provider_name, client = self.get_client(payload.get("provider"))
-        prompt = payload.get("prompt") or "Describe the image"
-        items = payload.get("images")
-        if not isinstance(items, list) or not items:
-            raise ValueError("'images' must be a non-empty list.")
-        model = payload.get("model")
-        if not hasattr(client, "vision"):
-            raise ValueError(f"Provider '{provider_name}' does not support batch vision analysis.")
-        results: List[Dict[str, Any]] = []
-        for image_entry in items:
-            prepared = self._prepare_images(provider_name, [image_entry])
-            response = client.vision(prompt, prepared, model=model)
-            results.append({"image": image_entry, "response": response})
-        return {"provider": provider_name, "results": results}
+    def batch(self, payload: VisionPayload) -> Dict[str, Any]:
+        provider_name, results = self.iter_batch(payload)
+        return {"provider": provider_name, "results": list(results)}
+
+    def iter_batch(self, payload: VisionPayload) -> Tuple[str, Iterator[Dict[str, Any]]]:
+        """Validate a batch payload and return ``(provider, results)``.
+
+        Validation happens immediately; the per-image results are produced
+        lazily, in request order, as the iterator is consumed.
+        """
+        provider_name, prompt, items, model = self._vision_arguments(payload)
+        vision = self._vision_fns[provider_name]
+
+        def _analyze(image_entry: Any) -> Dict[str, Any]:
+            try:
+                prepared = self._prepare_images(provider_name, [image_entry])
+                response = vision(prompt, prepared, model=model)
+            except (LLMClientError, ValueError, OSError) as exc:
+                LOGGER.error("Batch item failed: %s", exc)
+                return {"image": image_entry, "error": str(exc)}
+            return {"image": image_entry, "response": response}
+
+        def _results() -> Iterator[Dict[str, Any]]:
+            # Each item is an independent, I/O bound provider round-trip; map() keeps the input order.
+            workers = max(1, min(self.config.batch_workers, len(items)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                yield from executor.map(_analyze, items)
+
+        return provider_name, _results()
+
+    def _chat_arguments(self, payload: ChatPayload) -> Tuple[str, List[Dict[str, Any]], Any, Any]:
+        """Validate a chat payload into ``(provider, messages, model, temperature)``."""
+        request = convert(payload, ChatRequest)
+        return self._provider_name(request.provider), request.messages, request.model, request.temperature
+
+    def _vision_arguments(self, payload: VisionPayload) -> Tuple[str, str, List[Any], Any]:
+        """Validate an analyze/batch payload into ``(provider, prompt, images, model)``."""
+        request = convert(payload, VisionRequest)
+        prompt = request.prompt or "Describe the image"
+        return self._provider_name(request.provider), prompt, request.images, request.model
 
     def _prepare_images(self, provider: str, entries: Iterable[Any]) -> List[str]:
         prepared: List[str] = []
@@ -100,98 +300,186 @@ class MCPServerState:
         return prepared
 
     def _normalise_image_entry(self, entry: Any) -> Tuple[str, str | None]:
+        """Return ``(bare_base64, mime_type)`` for a request image entry."""
         if isinstance(entry, str):
             return self._load_image(entry)
         if isinstance(entry, dict):
             if "data_uri" in entry:
-                value = entry["data_uri"]
-                return value, None
+                return self._split_data_uri(entry["data_uri"])
             if "base64" in entry:
                 return entry["base64"], entry.get("mime")
             if "path" in entry:
                 return self._load_image(entry["path"], mime_hint=entry.get("mime"))
         raise ValueError("Unsupported image entry format. Use a path string or an object with 'path', 'base64' or 'data_uri'.")
 
+    @staticmethod
+    def _split_data_uri(value: Any) -> Tuple[str, str | None]:
+        header, separator, data = value.partition(",") if isinstance(value, str) else ("", "", "")
+        # Providers only accept base64 payloads, so URL-encoded data URIs are rejected rather than mangled.
+        if not separator or not header.startswith("data:") or not header.endswith(";base64"):
+            raise ValueError("'data_uri' must look like 'data:<mime>;base64,<data>'.")
+        return data, header[5:].split(";", 1)[0] or None
+
     def _load_image(self, path: str, mime_hint: str | None = None) -> Tuple[str, str | None]:
-        mime_type = mime_hint or mimetypes.guess_type(path)[0]
-        encoded = encode_image_to_base64(path)
+        mime_type = mime_hint or _guess_mime_type(path)
+        encoded = _ENCODE_CACHE.encode(path)
         return encoded, mime_type
 
     def _format_for_provider(self, provider: str, encoded: str, mime_type: str | None) -> str:
+        # LM Studio expects data URIs, Ollama takes the bare base64 payload.
         if provider == "lmstudio":
-            if encoded.startswith("data:"):
-                return encoded
-            mime = mime_type or "image/png"
-            return f"data:{mime};base64,{encoded}"
-        if provider == "ollama":
-            if encoded.startswith("data:"):
-                _, _, data = encoded.partition(",")
-                return data
-            return encoded
+            return f"data:{mime_type or 'image/png'};base64,{encoded}"
         return encoded
 
 
+# POST endpoints taking a JSON body: ChatRequest for /chat, VisionRequest for the others.
+_JSON_ENDPOINTS = frozenset({"/chat", "/analyze", "/batch", "/batch_stream"})
+
+
 class MCPRequestHandler(BaseHTTPRequestHandler):
     server_version = "DarktableMCP/0.1"
 
+    # The liveness probe is polled frequently and never changes: keep the whole response pre-encoded.
+    _HEALTH_BODY = b'{"status":"ok"}'
+    _HEALTH_RESPONSE = (
+        f"{BaseHTTPRequestHandler.protocol_version} 200 OK\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(_HEALTH_BODY)}\r\n"
+    ).encode("latin-1") + _CORS_HEADER_LINES + b"\r\n" + _HEALTH_BODY
+    # CORS preflight answers are just as static.
+    _OPTIONS_RESPONSE = (
+        f"{BaseHTTPRequestHandler.protocol_version} 204 No Content\r\n".encode("latin-1")
+        + _CORS_HEADER_LINES
+        + b"\r\n"
+    )
+
     def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
-        body = json.dumps(payload).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(body)))
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
-        self.end_headers()
-        self.wfile.write(body)
-
-    def _parse_json(self) -> Dict[str, Any]:
+        self._send_json_body(status, dumps(payload))
+
+    def _send_json_body(self, status: int, body: bytes) -> None:
+        """Send an already serialised JSON ``body``.
+
+        Status line, headers and body are assembled into one buffer and written
+        with a single call instead of one write for the headers and one for the body.
+        """
+        self.log_request(status, len(body))
+        response = bytearray(
+            (
+                f"{self.protocol_version} {status} {self.responses.get(status, ('',))[0]}\r\n"
+                f"Server: {self.version_string()}\r\n"
+                f"Date: {self.date_time_string()}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+            ).encode("latin-1")
+        )
+        response += _CORS_HEADER_LINES
+        response += b"\r\n"
+        response += body
+        self.wfile.write(response)
+
+    def _send_ndjson(self, provider: str, results: Iterator[Dict[str, Any]]) -> None:
+        """Stream batch ``results`` as JSON Lines, one object per image as soon as it is ready.
+
+        HTTP/1.1 clients get ``Transfer-Encoding: chunked``; older clients get
+        the lines unframed and the end of the body is signalled by closing the
+        connection.
+        """
+        chunked = self.request_version >= "HTTP/1.1"
+        self.close_connection = True
+        self.log_request(200)
+        head = (
+            f"{'HTTP/1.1' if chunked else self.protocol_version} 200 OK\r\n"
+            f"Server: {self.version_string()}\r\n"
+            f"Date: {self.date_time_string()}\r\n"
+            "Content-Type: application/x-ndjson\r\n"
+            + ("Transfer-Encoding: chunked\r\n" if chunked else "")
+            + "Connection: close\r\n"
+        ).encode("latin-1")
+        try:
+            self.wfile.write(head + _CORS_HEADER_LINES + b"\r\n")
+            while True:
+                try:
+                    item = next(results)
+                except StopIteration:
+                    break
+                except Exception as exc:  # headers are sent, so report the failure in-band
+                    LOGGER.exception("Batch stream aborted")
+                    self._write_ndjson_line({"provider": provider, "error": str(exc)}, chunked)
+                    break
+                self._write_ndjson_line({"provider": provider, **item}, chunked)
+            if chunked:
+                self.wfile.write(b"0\r\n\r\n")
+        except OSError as exc:
+            LOGGER.info("Client went away during batch stream: %s", exc)
+        finally:
+            # Cancels provider calls that have not started yet when the client disconnects.
+            close = getattr(results, "close", None)
+            if close is not None:
+                close()
+
+    def _write_ndjson_line(self, item: Dict[str, Any], chunked: bool) -> None:
+        line = dumps(item) + b"\n"
+        if chunked:
+            line = b"%x\r\n%s\r\n" % (len(line), line)
+        self.wfile.write(line)
+        self.wfile.flush()
+
+    def _parse_request(self, request_type: Type[RequestT]) -> RequestT:
         length = int(self.headers.get("Content-Length", "0"))
         if length <= 0:
             raise ValueError("Missing request body")
-        raw = self.rfile.read(length).decode("utf-8")
-        try:
-            return json.loads(raw)
-        except json.JSONDecodeError as exc:
-            raise ValueError(f"Invalid JSON payload: {exc.msg}") from exc
+        return decode(self.rfile, length, request_type)
+
+    def _parse_raw_image(self, query: str) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length", "0"))
+        if length <= 0:
+            raise ValueError("Missing request body")
+        body = bytearray(length)
+        view = memoryview(body)
+        received = 0
+        while received < length:
+            count = self.rfile.readinto(view[received:])
+            if not count:
+                raise ValueError("Truncated request body")
+            received += count
+        return _raw_image_payload(self.headers.get("Content-Type", ""), body, query)
 
     def do_OPTIONS(self) -> None:  # noqa: N802 (http method name)
-        self.send_response(204)
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
-        self.end_headers()
+        self.log_request(204)
+        self.wfile.write(self._OPTIONS_RESPONSE)
 
     def do_GET(self) -> None:  # noqa: N802
         parsed = urlparse(self.path)
         if parsed.path == "/health":
-            self._send_json(200, {"status": "ok"})
+            self.log_request(200, len(self._HEALTH_BODY))
+            self.wfile.write(self._HEALTH_RESPONSE)
             return
         if parsed.path == "/config":
             state: MCPServerState = self.server.state  # type: ignore[attr-defined]
-            self._send_json(200, state.config.as_dict())
+            self._send_json_body(200, state.config_body)
             return
         self._send_json(404, {"error": "Unknown endpoint"})
 
     def do_POST(self) -> None:  # noqa: N802
         parsed = urlparse(self.path)
-        try:
-            payload = self._parse_json()
-        except ValueError as exc:
-            self._send_json(400, {"error": str(exc)})
+        raw_image = parsed.path == "/analyze_raw"
+        if parsed.path not in _JSON_ENDPOINTS and not raw_image:
+            self._send_json(404, {"error": "Unknown endpoint"})
             return
 
         state: MCPServerState = self.server.state  # type: ignore[attr-defined]
         try:
-            if parsed.path == "/chat":
-                result = state.chat(payload)
-            elif parsed.path == "/analyze":
-                result = state.vision(payload)
-            elif parsed.path == "/batch":
-                result = state.batch(payload)
+            if raw_image:
+                result = state.vision(self._parse_raw_image(parsed.query))
+            elif parsed.path == "/chat":
+                result = state.chat(self._parse_request(ChatRequest))
             else:
-                self._send_json(404, {"error": "Unknown endpoint"})
-                return
+                request = self._parse_request(VisionRequest)
+                if parsed.path == "/batch_stream":
+                    provider_name, results = state.iter_batch(request)
+                    self._send_ndjson(provider_name, results)
+                    return
+                result = state.batch(request) if parsed.path == "/batch" else state.vision(request)
             self._send_json(200, result)
         except (ValueError, LLMClientError) as exc:
             LOGGER.error("Request processing failed: %s", exc)
@@ -210,9 +498,81 @@ class MCPServer:
     def __init__(self, config: MCPServerConfig):
         self._config = config
         self._state = MCPServerState(config)
-        self._httpd = ThreadedHTTPServer((config.host, config.port), MCPRequestHandler)
-        self._httpd.state = self._state  # type: ignore[attr-defined]
+        self._workers = _resolve_workers(config.workers)
+        self._httpd = self._create_httpd((config.host, config.port))
         self._thread: threading.Thread | None = None
+        self._worker_pids: List[int] = []
+        self._stop_lock = threading.Lock()
+        self._stopped = False
+
+    def _create_httpd(self, address: Tuple[str, int]) -> ThreadedHTTPServer:
+        server_class = ReusePortHTTPServer if self._workers > 1 else ThreadedHTTPServer
+        httpd = server_class(address, MCPRequestHandler)
+        httpd.state = self._state  # type: ignore[attr-defined]
+        return httpd
+
+    def spawn_workers(self) -> None:
+        """Fork the extra ``workers - 1`` processes; the current process keeps serving as well.
+
+        JSON and base64 work holds the GIL, so threads alone cannot use more
+        than one core.  Workers share nothing after the fork: each has its own
+        provider connection pools and image caches.
+
+        :meth:`start` and :meth:`wait_forever` call this themselves; callers
+        that start threads of their own should call it first, so the children
+        are forked from a single-threaded process.  Calling it again is a no-op.
+        """
+        if len(self._worker_pids) >= self._workers - 1:
+            return
+        parent_pid = os.getpid()
+        while len(self._worker_pids) < self._workers - 1:
+            pid = os.fork()
+            if pid == 0:  # pragma: no cover - runs in the child
+                self._run_worker(parent_pid)
+            self._worker_pids.append(pid)
+        LOGGER.info("Started %d additional worker processes", len(self._worker_pids))
+
+    def _run_worker(self, parent_pid: int) -> None:  # pragma: no cover - runs in a forked child
+        status = 0
+        try:
+            # Drop the inherited listener and bind a socket of our own so the kernel balances accepts per process.
+            # Use the port actually bound by the parent, which matters when the configured port is 0.
+            port = self._httpd.server_port
+            self._httpd.socket.close()
+            httpd = self._create_httpd((self._config.host, port))
+            # The parent stops workers with SIGTERM; only the waiter thread ever receives it.
+            signal.pthread_sigmask(signal.SIG_BLOCK, _WORKER_SIGNALS)
+
+            def _wait_for_signal() -> None:
+                # Also stop once the parent is gone (crash, SIGKILL): an orphaned worker would keep the port busy.
+                while signal.sigtimedwait(_WORKER_SIGNALS, _PARENT_POLL_INTERVAL) is None:
+                    if os.getppid() != parent_pid:
+                        LOGGER.warning("Worker process %s lost its parent, shutting down", os.getpid())
+                        break
+                httpd.shutdown()
+
+            threading.Thread(target=_wait_for_signal, name="mcp-worker-signal-waiter", daemon=True).start()
+            httpd.serve_forever()
+            httpd.server_close()
+        except BaseException:
+            LOGGER.exception("Worker process %s failed", os.getpid())
+            status = 1
+        finally:
+            # Never return into the parent's call stack (or run its atexit hooks) from the child.
+            os._exit(status)
+
+    def _stop_workers(self) -> None:
+        for pid in self._worker_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in self._worker_pids:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        self._worker_pids = []
 
     @property
     def config(self) -> MCPServerConfig:
@@ -222,10 +582,13 @@ class MCPServer:
         if self._thread and self._thread.is_alive():
             raise RuntimeError("Server already running")
         LOGGER.info("Starting MCP server on %s:%s", self._config.host, self._config.port)
+        # Fork before the serving thread exists so it is not part of the children's copy.
+        self.spawn_workers()
         self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
         self._thread.start()
 
     def wait_forever(self) -> None:
+        self.spawn_workers()
         try:
             self._httpd.serve_forever()
         except KeyboardInterrupt:  # pragma: no cover - manual shutdown
@@ -234,17 +597,35 @@ class MCPServer:
             self.stop()
 
     def stop(self) -> None:
-        LOGGER.info("Stopping MCP server")
-        self._httpd.shutdown()
-        self._httpd.server_close()
-        if self._thread:
-            self._thread.join(timeout=2)
-            self._thread = None
-
-
-def create_server(config: MCPServerConfig | None = None) -> MCPServer:
-    """Factory helper for external callers."""
-    return MCPServer(config or MCPServerConfig.from_env())
+        # A signal handler thread and wait_forever's cleanup may both get here; later callers wait for the
+        # first one to finish and then return.
+        with self._stop_lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            LOGGER.info("Stopping MCP server")
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._stop_workers()
+            if self._thread:
+                self._thread.join(timeout=2)
+                self._thread = None
+
+
+def create_server(config: MCPServerConfig | None = None) -> "MCPServer | AsyncMCPServer":
+    """Factory helper for external callers.
+
+    ``config.backend`` selects the threaded ``http.server`` implementation
+    (``"threaded"``) or the aiohttp based one (``"async"``).
+    """
+    config = config or MCPServerConfig.from_env()
+    if config.backend == "async":
+        from .server_async import AsyncMCPServer
+
+        return AsyncMCPServer(config)
+    if config.backend != "threaded":
+        raise ValueError(f"Unsupported server backend '{config.backend}'.")
+    return MCPServer(config)
 
 
 __all__ = [
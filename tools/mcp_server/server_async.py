@@ -0,0 +1,292 @@
+"""asyncio/aiohttp backend for the Darktable MCP server.
+
+Requests are served by coroutines on a single event loop and provider
+calls share one pooled ``aiohttp.ClientSession``, so many in-flight
+requests no longer need one OS thread each.  Selected with
+``MCPServerConfig.backend = "async"``; requires ``aiohttp``.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from functools import partial
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Tuple, Type
+
+try:  # pragma: no cover - optional dependency
+    import aiohttp
+    from aiohttp import web
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore[assignment]
+    web = None  # type: ignore[assignment]
+
+from .clients import LLMClientError
+from .config import MCPServerConfig
+from .jsonutil import dumps
+from .schema import ChatRequest, RequestT, VisionRequest, decode_bytes
+from .server import _CORS, ChatPayload, MCPServerState, VisionPayload, _raw_image_payload
+
+LOGGER = logging.getLogger(__name__)
+
+_CORS_HEADERS = dict(_CORS)
+
+# JSON POST endpoints answered with a single JSON response (see _handle_post).
+_POST_ENDPOINTS = ("/chat", "/analyze", "/batch")
+
+
+class AsyncMCPServerState(MCPServerState):
+    """Coroutine flavour of :class:`MCPServerState` bound to a client session."""
+
+    def __init__(self, config: MCPServerConfig, session: "aiohttp.ClientSession"):
+        super().__init__(config)
+        self._session = session
+        lm_studio, ollama = self._clients["lmstudio"], self._clients["ollama"]
+        self._async_chat_fns: Dict[str, Callable[[List[Dict[str, Any]], Any, Any], Awaitable[Dict[str, Any]]]] = {
+            "lmstudio": lambda messages, model, temperature: lm_studio.async_chat(
+                session, messages, model=model, temperature=temperature
+            ),
+            "ollama": lambda messages, model, temperature: ollama.async_chat(session, messages, model=model),
+        }
+        self._async_vision_fns: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {
+            "lmstudio": partial(lm_studio.async_vision, session),
+            "ollama": partial(ollama.async_vision, session),
+        }
+
+    async def _prepare_images_async(self, provider: str, entries: List[Any]) -> List[str]:
+        # Reading and encoding files blocks, keep it off the event loop.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self._prepare_images, provider, entries))
+
+    async def async_chat(self, payload: ChatPayload) -> Dict[str, Any]:
+        provider_name, messages, model, temperature = self._chat_arguments(payload)
+        response = await self._async_chat_fns[provider_name](messages, model, temperature)
+        return {"provider": provider_name, "response": response}
+
+    async def async_vision(self, payload: VisionPayload) -> Dict[str, Any]:
+        provider_name, prompt, images, model = self._vision_arguments(payload)
+        prepared_images = await self._prepare_images_async(provider_name, images)
+        response = await self._async_vision_fns[provider_name](prompt, prepared_images, model=model)
+        return {"provider": provider_name, "response": response}
+
+    async def async_batch(self, payload: VisionPayload) -> Dict[str, Any]:
+        provider_name, results = self.async_iter_batch(payload)
+        return {"provider": provider_name, "results": [item async for item in results]}
+
+    def async_iter_batch(self, payload: VisionPayload) -> Tuple[str, AsyncGenerator[Dict[str, Any], None]]:
+        """Validate a batch payload and return ``(provider, results)`` with results yielded in request order."""
+        provider_name, prompt, items, model = self._vision_arguments(payload)
+        vision = self._async_vision_fns[provider_name]
+        limit = asyncio.Semaphore(max(1, self.config.batch_workers))
+
+        async def _analyze(image_entry: Any) -> Dict[str, Any]:
+            async with limit:
+                try:
+                    prepared = await self._prepare_images_async(provider_name, [image_entry])
+                    response = await vision(prompt, prepared, model=model)
+                except (LLMClientError, ValueError, OSError) as exc:
+                    LOGGER.error("Batch item failed: %s", exc)
+                    return {"image": image_entry, "error": str(exc)}
+                return {"image": image_entry, "response": response}
+
+        async def _results() -> AsyncGenerator[Dict[str, Any], None]:
+            tasks = [asyncio.ensure_future(_analyze(entry)) for entry in items]
+            try:
+                for task in tasks:
+                    yield await task
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        return provider_name, _results()
+
+
+def _json_response(status: int, payload: Dict[str, Any]) -> "web.Response":
+    return _json_body_response(status, dumps(payload))
+
+
+def _json_body_response(status: int, body: bytes) -> "web.Response":
+    return web.Response(status=status, body=body, content_type="application/json", headers=_CORS_HEADERS)
+
+
+class AsyncMCPServer:
+    """aiohttp based server exposing the same interface as :class:`MCPServer`."""
+
+    def __init__(self, config: MCPServerConfig):
+        if aiohttp is None:
+            raise RuntimeError("The async backend requires aiohttp (pip install aiohttp).")
+        if config.workers != 1:
+            LOGGER.warning("The async backend runs in a single process, ignoring workers=%s", config.workers)
+        self._config = config
+        self._state: AsyncMCPServerState | None = None
+        self._stopping = threading.Event()
+        self._stop_lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop_event: asyncio.Event | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def config(self) -> MCPServerConfig:
+        return self._config
+
+    @property
+    def _running_state(self) -> AsyncMCPServerState:
+        # Only unset outside the application's lifetime, when no request handler runs.
+        if self._state is None:
+            raise RuntimeError("The async MCP server is not running")
+        return self._state
+
+    def _build_app(self) -> "web.Application":
+        # Bodies carry base64 images, so lift aiohttp's default 1 MiB cap like the threaded backend.
+        app = web.Application(client_max_size=0)
+        app.router.add_get("/health", self._handle_health)
+        app.router.add_get("/config", self._handle_config)
+        for path in _POST_ENDPOINTS:
+            app.router.add_post(path, self._handle_post)
+        app.router.add_post("/analyze_raw", self._handle_analyze_raw)
+        app.router.add_post("/batch_stream", self._handle_batch_stream)
+        app.router.add_route("OPTIONS", "/{tail:.*}", self._handle_options)
+        app.router.add_route("GET", "/{tail:.*}", self._handle_not_found)
+        app.router.add_route("POST", "/{tail:.*}", self._handle_not_found)
+        app.cleanup_ctx.append(self._client_session)
+        return app
+
+    async def _client_session(self, app: "web.Application"):
+        connector = aiohttp.TCPConnector(limit=64, keepalive_timeout=60)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            self._state = AsyncMCPServerState(self._config, session)
+            yield
+            self._state = None
+
+    async def _handle_health(self, request: "web.Request") -> "web.Response":
+        return _json_response(200, {"status": "ok"})
+
+    async def _handle_config(self, request: "web.Request") -> "web.Response":
+        return _json_body_response(200, self._running_state.config_body)
+
+    async def _handle_options(self, request: "web.Request") -> "web.Response":
+        return web.Response(status=204, headers=_CORS_HEADERS)
+
+    async def _handle_not_found(self, request: "web.Request") -> "web.Response":
+        return _json_response(404, {"error": "Unknown endpoint"})
+
+    @staticmethod
+    async def _read_request(request: "web.Request", request_type: Type[RequestT]) -> RequestT:
+        raw = await request.read()
+        if not raw:
+            raise ValueError("Missing request body")
+        return decode_bytes(raw, request_type)
+
+    async def _handle_post(self, request: "web.Request") -> "web.Response":
+        state = self._running_state
+        operation: Awaitable[Dict[str, Any]]
+        try:
+            if request.path == "/chat":
+                operation = state.async_chat(await self._read_request(request, ChatRequest))
+            else:
+                vision_request = await self._read_request(request, VisionRequest)
+                run = state.async_batch if request.path == "/batch" else state.async_vision
+                operation = run(vision_request)
+        except ValueError as exc:
+            return _json_response(400, {"error": str(exc)})
+        return await self._run(operation)
+
+    async def _handle_batch_stream(self, request: "web.Request") -> "web.StreamResponse":
+        try:
+            payload = await self._read_request(request, VisionRequest)
+            provider_name, results = self._running_state.async_iter_batch(payload)
+        except ValueError as exc:
+            LOGGER.error("Request processing failed: %s", exc)
+            return _json_response(400, {"error": str(exc)})
+        # No Content-Length: aiohttp frames the body with chunked encoding for HTTP/1.1 clients.
+        response = web.StreamResponse(status=200, headers=_CORS_HEADERS)
+        response.content_type = "application/x-ndjson"
+        await response.prepare(request)
+        try:
+            async for item in results:
+                await response.write(dumps({"provider": provider_name, **item}) + b"\n")
+        except (ConnectionError, asyncio.CancelledError):
+            raise
+        except Exception as exc:  # headers are sent, so report the failure in-band
+            LOGGER.exception("Batch stream aborted")
+            await response.write(dumps({"provider": provider_name, "error": str(exc)}) + b"\n")
+        finally:
+            await results.aclose()
+        await response.write_eof()
+        return response
+
+    async def _handle_analyze_raw(self, request: "web.Request") -> "web.Response":
+        raw = await request.read()
+        if not raw:
+            return _json_response(400, {"error": "Missing request body"})
+        try:
+            payload = _raw_image_payload(request.headers.get("Content-Type", ""), raw, request.query_string)
+        except ValueError as exc:
+            return _json_response(400, {"error": str(exc)})
+        return await self._run(self._running_state.async_vision(payload))
+
+    async def _run(self, operation: Awaitable[Dict[str, Any]]) -> "web.Response":
+        try:
+            result = await operation
+        except (ValueError, LLMClientError) as exc:
+            LOGGER.error("Request processing failed: %s", exc)
+            return _json_response(400, {"error": str(exc)})
+        except Exception as exc:  # pragma: no cover - defensive programming
+            LOGGER.exception("Unexpected server error")
+            return _json_response(500, {"error": str(exc)})
+        return _json_response(200, result)
+
+    async def _serve(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        if self._stopping.is_set():
+            return
+        runner = web.AppRunner(self._build_app(), access_log=LOGGER)
+        await runner.setup()
+        try:
+            site = web.TCPSite(runner, self._config.host, self._config.port)
+            await site.start()
+            await self._stop_event.wait()
+        finally:
+            await runner.cleanup()
+            self._loop = None
+
+    def spawn_workers(self) -> None:
+        """No-op counterpart of :meth:`MCPServer.spawn_workers`; this backend runs in one process."""
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            raise RuntimeError("Server already running")
+        LOGGER.info("Starting async MCP server on %s:%s", self._config.host, self._config.port)
+        self._stopping.clear()
+        self._thread = threading.Thread(target=asyncio.run, args=(self._serve(),), daemon=True)
+        self._thread.start()
+
+    def wait_forever(self) -> None:
+        self._stopping.clear()
+        try:
+            asyncio.run(self._serve())
+        except KeyboardInterrupt:  # pragma: no cover - manual shutdown
+            LOGGER.info("Shutting down after interrupt")
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        # May be called from any thread, and more than once: only the first call after a start stops the server.
+        with self._stop_lock:
+            if self._stopping.is_set():
+                return
+            self._stopping.set()
+        LOGGER.info("Stopping MCP server")
+        # Hand the wake-up to the event loop.
+        loop, stop_event = self._loop, self._stop_event
+        if loop is not None and stop_event is not None:
+            try:
+                loop.call_soon_threadsafe(stop_event.set)
+            except RuntimeError:  # loop already closed
+                pass
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+
+__all__ = ["AsyncMCPServer", "AsyncMCPServerState"]